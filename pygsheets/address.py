@@ -1,4 +1,5 @@
 from pygsheets.exceptions import InvalidArgumentValue, IncorrectCellLabel
+from pygsheets.utils import format_addr
 import re
 
 
@@ -111,15 +112,8 @@ class Address(object):
             row_label = str(self._value[0])
 
         if self._value[1]:
-            col = int(self._value[1])
-            div = col
-            column_label = ''
-            while div:
-                (div, mod) = divmod(div, 26)
-                if mod == 0:
-                    mod = 26
-                    div -= 1
-                column_label = chr(mod + self._MAGIC_NUMBER) + column_label
+            # format_addr caches its conversions, so repeated labels skip the base-26 math
+            column_label = format_addr((None, int(self._value[1])), 'label')
 
         return '{}{}'.format(column_label, row_label)
 
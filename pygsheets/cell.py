@@ -447,6 +447,12 @@ class Cell(object):
         else:
             return False
 
+    def _set_synced_value(self, value):
+        """Store a raw text value which was already written to the worksheet, without sending it again."""
+        self.__dict__['_value'] = value
+        self.__dict__['_unformated_value'] = value
+        self.__dict__['_formula'] = ''
+
     def refresh(self):
         """Refresh the value and properties in this cell from the linked worksheet.
            Same as fetch.
@@ -3,6 +3,7 @@ import re
 import warnings
 import os
 import logging
+from contextlib import contextmanager
 
 
 from pygsheets.drive import DriveAPIWrapper
@@ -17,9 +18,11 @@ import httplib2
 
 GOOGLE_SHEET_CELL_UPDATES_LIMIT = 50000
 
-_url_key_re_v1 = re.compile(r'key=([^&#]+)')
-_url_key_re_v2 = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
-_email_patttern = re.compile(r"\"?([-a-zA-Z0-9.`?{}]+@[-a-zA-Z0-9.]+\.\w+)\"?")
+_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+_url_key_re = re.compile(r"key=(?P<v1>[^&#]+)|/spreadsheets/d/(?P<v2>[a-zA-Z0-9-_]+)", re.ASCII)
+_email_pattern = re.compile(r"\"?([-a-zA-Z0-9.`?{}]+@[-a-zA-Z0-9.]+\.\w+)\"?", re.ASCII)
+_email_patttern = _email_pattern  # backwards compatible alias
 # _domain_pattern = re.compile("(?!-)[A-Z\d-]{1,63}(?<!-)$", re.IGNORECASE)
 
 _deprecated_keyword_mapping = {
@@ -45,7 +48,9 @@ class Client(object):
     :param retries:                 (Optional) Number of times to retry a connection before raising a TimeOut error.
                                     Default: 3
     :param http:                    The underlying HTTP object to use to make requests. If not specified, a
-                                    :class:`httplib2.Http` instance will be constructed.
+                                    :class:`httplib2.Http` instance will be constructed. It is shared by the
+                                    sheets and drive wrappers, so open connections are reused across requests.
+                                    Reuse one client rather than creating a new one per task.
     :param check:                   Check for quota error and apply rate limiting.
     :param seconds_per_quota:       Default value is 100 seconds
 
@@ -61,10 +66,8 @@ class Client(object):
             http = AuthorizedHttp(credentials, http=httplib2.Http())
         else:
             http = AuthorizedHttp(credentials, http=http)
-        data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-
-        self.sheet = SheetAPIWrapper(http, data_path, retries=retries, check=check, seconds_per_quota=seconds_per_quota, request_builder=self.__build_request)
-        self.drive = DriveAPIWrapper(http, data_path, request_builder=self.__build_request)
+        self.sheet = SheetAPIWrapper(http, _DATA_PATH, retries=retries, check=check, seconds_per_quota=seconds_per_quota, request_builder=self.__build_request)
+        self.drive = DriveAPIWrapper(http, _DATA_PATH, request_builder=self.__build_request)
 
 
     def __build_request(self,http, *args, **kwargs):
@@ -85,7 +88,7 @@ class Client(object):
 
     def spreadsheet_ids(self, query=None):
         """Get a list of all spreadsheet ids present in the Google Drive or TeamDrive accessed."""
-        return [x['id'] for x in self.drive.spreadsheet_metadata(query)]
+        return [x['id'] for x in self.drive.spreadsheet_metadata(query, fields='id')]
 
     def set_batch_mode(self, value):
         """Set the client in batch mode. If True will batch all custom requests and wil combine them
@@ -97,9 +100,29 @@ class Client(object):
         """Run currently batched requests."""
         self.sheet.run_batch()
 
+    @contextmanager
+    def batch(self):
+        """Context manager which batches all custom requests made inside it and runs them as a single request
+        per spreadsheet on exit. If an exception is raised inside the block the batched requests are discarded.
+
+        >>> with gc.batch():
+        ...     wks.merge_cells("A1", "A2")
+        ...     pygsheets.DataRange("D1", "D5", wks).apply_format(cell)
+        """
+        if self.sheet.batch_mode:
+            # already batching, the outermost block will run the requests
+            yield self
+            return
+        self.set_batch_mode(True)
+        try:
+            yield self
+            self.run_batch()
+        finally:
+            self.set_batch_mode(False)
+
     def spreadsheet_titles(self, query=None):
         """Get a list of all spreadsheet titles present in the Google Drive or TeamDrive accessed."""
-        return [x['name'] for x in self.drive.spreadsheet_metadata(query)]
+        return [x['name'] for x in self.drive.spreadsheet_metadata(query, fields='name')]
 
     def create(self, title, template=None, folder=None, folder_name=None, **kwargs):
         """Create a new spreadsheet.
@@ -128,9 +151,11 @@ class Client(object):
             folder = self.drive.get_folder_id(folder_name)
 
         result = self.sheet.create(title, template=template, **kwargs)
+        self.drive.clear_metadata_cache()
         if folder:
             self.drive.move_file(result['spreadsheetId'],
-                                 old_folder=self.drive.spreadsheet_metadata(fid=result['spreadsheetId']).get('parents', [None])[0],
+                                 old_folder=self.drive.spreadsheet_metadata(fid=result['spreadsheetId'],
+                                                                            fields='parents').get('parents', [None])[0],
                                  new_folder=folder)
         return self.spreadsheet_cls(self, jsonsheet=result)
 
@@ -149,10 +174,10 @@ class Client(object):
         :raises pygsheets.SpreadsheetNotFound:  No spreadsheet with the given title was found.
         """
         try:
-            spreadsheet = list(filter(lambda x: x['name'] == title, self.drive.spreadsheet_metadata()))[0]
-            return self.open_by_key(spreadsheet['id'])
-        except (KeyError, IndexError):
+            key = next(x['id'] for x in self.drive.spreadsheet_metadata(fields='id, name') if x['name'] == title)
+        except StopIteration:
             raise SpreadsheetNotFound('Could not find a spreadsheet with title %s.' % title)
+        return self.open_by_key(key)
 
     def open_by_key(self, key):
         """Open a spreadsheet by key.
@@ -179,16 +204,10 @@ class Client(object):
         :returns:                               :class:`~pygsheets.Spreadsheet`
         :raises pygsheets.SpreadsheetNotFound:  No spreadsheet was found with the given URL.
         """
-        m1 = _url_key_re_v1.search(url)
-        if m1:
-            return self.open_by_key(m1.group(1))
-
-        else:
-            m2 = _url_key_re_v2.search(url)
-            if m2:
-                return self.open_by_key(m2.group(1))
-            else:
-                raise NoValidUrlKeyFound
+        m = _url_key_re.search(url)
+        if m is None:
+            raise NoValidUrlKeyFound
+        return self.open_by_key(m.group('v1') or m.group('v2'))
 
     def open_all(self, query=''):
         """Opens all available spreadsheets.
@@ -200,7 +219,8 @@ class Client(object):
         :param query:   (Optional) Can be used to filter the returned metadata.
         :returns:       A list of :class:`~pygsheets.Spreadsheet`.
         """
-        return [self.open_by_key(key) for key in self.spreadsheet_ids(query=query)]
+        responses = self.sheet.batch_get(self.spreadsheet_ids(query=query), includeGridData=False)
+        return [self.spreadsheet_cls(self, response) for response in responses]
 
     def open_as_json(self, key):
         """Return a json representation of the spreadsheet.
@@ -10,16 +10,24 @@ This module contains common Enums used in pygsheets
 
 from enum import Enum
 
+__all__ = ['WorkSheetProperty', 'ValueRenderOption', 'DateTimeRenderOption', 'FormatType', 'ExportType',
+           'HorizontalAlignment', 'VerticalAlignment', 'ChartType']
+
+
+class _StrEnum(str, Enum):
+    """Enum whose members are also instances of their string value."""
+    __str__ = str.__str__
+
 
 # @TODO use this
-class WorkSheetProperty(Enum):
+class WorkSheetProperty(_StrEnum):
     """available properties of worksheets"""
     TITLE = 'title'
     ID = 'id'
     INDEX = 'index'
 
 
-class ValueRenderOption(Enum):
+class ValueRenderOption(_StrEnum):
     """Determines how values should be rendered in the output.
 
     `ValueRenderOption Docs <https://developers.google.com/sheets/api/reference/rest/v4/ValueRenderOption>`_
@@ -41,7 +49,7 @@ class ValueRenderOption(Enum):
     FORMULA = 'FORMULA'
 
 
-class DateTimeRenderOption(Enum):
+class DateTimeRenderOption(_StrEnum):
     """Determines how dates should be rendered in the output.
 
     `DateTimeRenderOption Doc <https://developers.google.com/sheets/api/reference/rest/v4/DateTimeRenderOption>`_
@@ -73,7 +81,7 @@ class FormatType(Enum):
     SCIENTIFIC = 'SCIENTIFIC'
 
 
-class ExportType(Enum):
+class ExportType(_StrEnum):
     """Enum for possible export types
 
     `Export MIME types doc <https://developers.google.com/drive/api/guides/ref-export-formats>`_
@@ -111,7 +119,7 @@ class VerticalAlignment(Enum):
     NONE = None
 
 
-class ChartType(Enum):
+class ChartType(_StrEnum):
     """Enum for basic chart types
 
     Reference: `insert request <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets#BasicChartType>`_
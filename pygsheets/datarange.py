@@ -9,10 +9,14 @@ This module contains DataRange class.
 """
 
 import logging
+from itertools import chain
 
 from pygsheets.address import GridRange
 from pygsheets.exceptions import InvalidArgumentValue, CellNotFound
 
+DEFAULT_FORMAT_FIELDS = "userEnteredFormat,hyperlink,note,textFormatRuns,dataValidation,pivotTable"
+BORDER_STYLES = frozenset(['SOLID', 'DOTTED', 'DASHED', 'SOLID_MEDIUM', 'SOLID_THICK', 'DOUBLE', 'NONE'])
+
 
 class DataRange(object):
     """
@@ -45,32 +49,43 @@ class DataRange(object):
 
     """
 
+    __slots__ = ('_worksheet', 'protected_properties', '_gridrange_cache', '_range_cache', 'grid_range', '_data',
+                 '_fetched', '_linked', '_name_id', '_name')
+
+    logger = logging.getLogger(__name__)
+
     def __init__(self, start=None, end=None, worksheet=None, name='', data=None, name_id=None, namedjson=None,
                  protectedjson=None, grange=None):
         self._worksheet = worksheet
-        self.logger = logging.getLogger(__name__)
-        self.protected_properties = ProtectedRangeProperties()
-        if grange:
-            self.grid_range = grange
-        else:
-            self.grid_range = GridRange(worksheet=worksheet, start=start, end=end)
+        self.protected_properties = ProtectedRangeProperties(protectedjson)
+        self._gridrange_cache = None
+        self._range_cache = None
 
+        range_json = None
         if namedjson:
-            self.grid_range.set_json(namedjson['range'])
+            range_json = namedjson['range']
             name_id = namedjson['namedRangeId']
             name = namedjson['name']
         if protectedjson:
-            self.grid_range.set_json(protectedjson['range'])
+            range_json = protectedjson['range']
             name_id = protectedjson.get('namedRangeId', '')  # @TODO get the name also
-            self.protected_properties = ProtectedRangeProperties(protectedjson)
 
-        if data:
-            if len(data) == self.grid_range.height and len(data[0]) == self.grid_range.width:
-                self._data = data
-            else:
-                self.fetch()
+        if grange:
+            self.grid_range = grange
+            if range_json is not None:
+                self.grid_range.set_json(range_json)
+        elif range_json is not None:
+            # build the range straight from the json instead of resolving start and end first
+            self.grid_range = GridRange(worksheet=worksheet, propertiesjson=range_json)
+        else:
+            self.grid_range = GridRange(worksheet=worksheet, start=start, end=end)
+
+        if data and len(data) == self.grid_range.height and len(data[0]) == self.grid_range.width:
+            self._data = data
+            self._fetched = True
         else:
-            self._data = [[]]
+            self._data = [[]]  # cells are fetched on first access
+            self._fetched = False
 
         self._linked = True
         self._name_id = name_id
@@ -85,8 +100,10 @@ class DataRange(object):
 
     @name.setter
     def name(self, name):
-        if type(name) is not str:
+        if not isinstance(name, str):
             raise InvalidArgumentValue('name should be a string')
+        if name == self._name and (self._name_id or not name):
+            return
         if not name:
             self._worksheet.delete_named_range(range_id=self._name_id)
             self._name = ''
@@ -95,13 +112,13 @@ class DataRange(object):
             if not self._name_id:
                 # @TODO handle when not linked (create an range on link)
                 if not self._linked:
-                    self.logger.warn("unimplimented bahaviour")
+                    self.logger.warning("unimplimented bahaviour")
                 api_obj = self._worksheet.create_named_range(name, grange=self.grid_range, returnas='json')
                 self._name = name
                 self._name_id = api_obj['namedRangeId']
             else:
                 self._name = name
-                self.update_named_range()
+                self.update_named_range(fields='name')
 
     @property
     def name_id(self):
@@ -124,15 +141,14 @@ class DataRange(object):
 
     @protected.setter
     def protected(self, value):
-        if value:
-            if not self.protected:
-                resp = self._worksheet.create_protected_range(grange=self.grid_range, named_range_id=self._name_id,
-                                                              returnas='json')
-                self.protected_properties.set_json(resp)
-        else:
-            if self.protected:
-                self._worksheet.remove_protected_range(self.protect_id)
-                self.protected_properties.clear()
+        protected = self.protected_properties.is_protected()
+        if value and not protected:
+            resp = self._worksheet.create_protected_range(grange=self.grid_range, named_range_id=self._name_id,
+                                                          returnas='json')
+            self.protected_properties.set_json(resp)
+        elif not value and protected:
+            self._worksheet.remove_protected_range(self.protected_properties.protected_id)
+            self.protected_properties.clear()
 
     @property
     def editors(self):
@@ -145,9 +161,12 @@ class DataRange(object):
 
     @editors.setter
     def editors(self, value):
-        if type(value) is not tuple or value[0] not in ['users', 'groups', 'domainUsersCanEdit']:
+        if not isinstance(value, tuple) or value[0] not in ['users', 'groups', 'domainUsersCanEdit']:
             raise InvalidArgumentValue
-        self.protected_properties.editors[value[0]] = value[1]
+        editors = self.protected_properties.editors
+        if value[0] in editors and editors[value[0]] == value[1]:
+            return
+        editors[value[0]] = value[1]
         self.update_protected_range(fields='editors')
 
     @property
@@ -157,6 +176,8 @@ class DataRange(object):
 
     @requesting_user_can_edit.setter
     def requesting_user_can_edit(self, value):
+        if value == self.protected_properties.requestingUserCanEdit:
+            return
         self.protected_properties.requestingUserCanEdit = value
         self.update_protected_range(fields='requestingUserCanEdit')
 
@@ -167,6 +188,8 @@ class DataRange(object):
 
     @description.setter
     def description(self, value):
+        if value == self.protected_properties.description:
+            return
         self.protected_properties.description = value
         self.update_protected_range(fields='description')
 
@@ -179,9 +202,14 @@ class DataRange(object):
 
     @start_addr.setter
     def start_addr(self, addr):
+        old_index = self.grid_range.start.index
         self.grid_range.start = addr
-        self.update_named_range()
-        self.update_protected_range()
+        if self.grid_range.start.index == old_index:
+            return
+        self._gridrange_cache = None
+        # a named range update also pushes the protected range
+        if self.update_named_range(fields='range') is False:
+            self.update_protected_range()
 
     @property
     def end_addr(self):
@@ -190,14 +218,23 @@ class DataRange(object):
 
     @end_addr.setter
     def end_addr(self, addr):
+        old_index = self.grid_range.end.index
         self.grid_range.end = addr
-        self.update_named_range()
-        self.update_protected_range()
+        if self.grid_range.end.index == old_index:
+            return
+        self._gridrange_cache = None
+        # a named range update also pushes the protected range
+        if self.update_named_range(fields='range') is False:
+            self.update_protected_range()
 
     @property
     def range(self):
         """Range in format A1:C5"""
-        return self.grid_range.start.label + ':' + self.grid_range.end.label
+        # the label is rebuilt only if the indexes of the range have changed
+        key = (self.grid_range.start.index, self.grid_range.end.index)
+        if self._range_cache is None or self._range_cache[0] != key:
+            self._range_cache = (key, self.grid_range.start.label + ':' + self.grid_range.end.label)
+        return self._range_cache[1]
 
     @property
     def worksheet(self):
@@ -207,7 +244,7 @@ class DataRange(object):
     @property
     def cells(self):
         """Get cells of this range"""
-        if len(self._data[0]) == 0:
+        if not self._fetched:
             self.fetch()
         return self._data
 
@@ -220,7 +257,14 @@ class DataRange(object):
             raise InvalidArgumentValue("No worksheet defined to link this range to.")
         self._linked = True
 
-        [[y.link(worksheet=self._worksheet, update=update) for y in x] for x in self._data]
+        # dirty cells are synced together in a single batch update
+        requests = []
+        for cell in chain.from_iterable(self._data):
+            if update and cell.is_dirty:
+                requests.append(cell.update(get_request=True, worksheet_id=self._worksheet.id))
+            cell.link(worksheet=self._worksheet, update=False)
+        if requests:
+            self._worksheet.client.sheet.batch_update(self._worksheet.spreadsheet.id, requests)
         if update:
             self.update_protected_range()
             self.update_named_range()
@@ -228,7 +272,8 @@ class DataRange(object):
     def unlink(self):
         """unlink the sheet so that all properties are not synced as it is changed"""
         self._linked = False
-        [[y.unlink() for y in x] for x in self._data]
+        for cell in chain.from_iterable(self._data):
+            cell.unlink()
 
     def fetch(self, only_data=True):
         """
@@ -242,12 +287,14 @@ class DataRange(object):
         """
         self._data = self._worksheet.get_values(grange=self.grid_range, returnas='cells',
                                                 include_tailing_empty_rows=True, include_tailing_empty=True)
+        self._fetched = True
         if not only_data:
             logging.error("functionality not implimented")
 
     def apply_format(self, cell=None, fields=None, cell_json=None):
         """
-        Change format of all cells in the range
+        Change format of all cells in the range. To format several ranges in a single request
+        use :meth:`Worksheet.apply_format <pygsheets.Worksheet.apply_format>`.
 
         :param cell: a model :class: Cell whose format will be applied to all cells
         :param fields: comma seprated string of fields of cell to apply, refer to `google api docs <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/cells#CellFormat>`__
@@ -258,24 +305,42 @@ class DataRange(object):
         request = {"repeatCell": {
             "range": self._get_gridrange(),
             "cell": cell_json,
-            "fields": fields or "userEnteredFormat,hyperlink,note,textFormatRuns,dataValidation,pivotTable"
+            "fields": fields or DEFAULT_FORMAT_FIELDS
             }
         }
         self._worksheet.client.sheet.batch_update(self._worksheet.spreadsheet.id, request)
 
-    def update_values(self, values=None):
+    def update_values(self, values=None, refresh=False):
         """
         Update the worksheet with values of the cells in this range
 
         :param values: values as matrix, which has same size as the range
+        :param refresh: fetch the cells from cloud after the update. Otherwise, when the spreadsheet does not parse
+                        input and all values are plain text, the values are stored in the already fetched cells
+                        directly. Any other values are always fetched.
 
         """
         if self._linked and values:
             self._worksheet.update_values(crange=self.range, values=values)
-            self.fetch()
+            if refresh or not self._set_local_values(values):
+                self.fetch()
         if self._linked and not values:
             self._worksheet.update_values(cell_list=self._data)
 
+    def _set_local_values(self, values):
+        """store values in the fetched cells, returns False if the cells need to be fetched instead"""
+        if not self._fetched or len(values) != len(self._data) or \
+                any(len(row) != len(cells) or not cells for row, cells in zip(values, self._data)):
+            return False
+        # only raw text is stored exactly as given, parsed input and formulas have to be read back
+        if self._worksheet.spreadsheet.default_parse or \
+                any(not isinstance(value, str) or value.startswith('=') for row in values for value in row):
+            return False
+        for row, cells in zip(values, self._data):
+            for value, cell in zip(row, cells):
+                cell._set_synced_value(value)
+        return True
+
     def sort(self, basecolumnindex=0, sortorder="ASCENDING"):
         """sort the values in the datarange
 
@@ -300,35 +365,47 @@ class DataRange(object):
         """
         self._worksheet.clear(grange=self.grid_range, fields=fields)
 
-    def update_named_range(self):
-        """update the named range properties"""
+    def update_named_range(self, fields='*'):
+        """update the named range properties
+
+        :param fields: named range fields to update, as a field mask
+        """
         if not self._name_id or not self._linked:
             return False
-        if self.protected:
-            self.update_protected_range()
-        request = {'updateNamedRange': {
+        requests = []
+        # a protected named range is updated along with it in the same request
+        if self.protected_properties.is_protected():
+            requests.append(self.update_protected_range(get_request=True))
+        requests.append({'updateNamedRange': {
           "namedRange": {
               "namedRangeId": self._name_id,
               "name": self._name,
               "range": self._get_gridrange(),
           },
-          "fields": '*',
-        }}
-        self._worksheet.client.sheet.batch_update(self._worksheet.spreadsheet.id, request)
+          "fields": fields,
+        }})
+        self._worksheet.client.sheet.batch_update(self._worksheet.spreadsheet.id, requests)
+
+    def update_protected_range(self, fields='*', get_request=False):
+        """ update the protected range properties
 
-    def update_protected_range(self, fields='*'):
-        """ update the protected range properties """
-        if not self.protected or not self._linked:
+        :param fields: protected range fields to update, as a field mask
+        :param get_request: return the request object instead of sending the request directly
+        """
+        if not self._linked or not self.protected_properties.is_protected():
             return False
 
+        protected_range = self.protected_properties.to_json()
+        if self._name_id:
+            protected_range['namedRangeId'] = self._name_id
+        else:
+            protected_range['range'] = self._get_gridrange()
         request = {'updateProtectedRange': {
-          "protectedRange": self.protected_properties.to_json(),
+          "protectedRange": protected_range,
           "fields": fields,
         }}
-        if self._name_id:
-            request['updateProtectedRange']['protectedRange']['namedRangeId'] = self._name_id
-        else:
-            request['updateProtectedRange']['protectedRange']['range'] = self._get_gridrange()
+        if get_request:
+            return request
         self._worksheet.client.sheet.batch_update(self._worksheet.spreadsheet.id, request)
 
     def update_borders(self, top=False, right=False, bottom=False, left=False, inner_horizontal=False, inner_vertical=False,
@@ -343,7 +420,7 @@ class DataRange(object):
         :param right: make a right border
         :param bottom: make a bottom border
         :param left: make a left border
-        :param style: either 'SOLID', 'DOTTED', 'DASHED', 'SOLID', 'SOLID_MEDIUM', 'SOLID_THICK', 'DOUBLE' or 'NONE' (String).
+        :param style: either 'SOLID', 'DOTTED', 'DASHED', 'SOLID_MEDIUM', 'SOLID_THICK', 'DOUBLE' or 'NONE' (String).
         :param width: border width (depreciated) (Integer).
         :param red: 0-255 (Integer).
         :param green: 0-255 (Integer).
@@ -352,11 +429,9 @@ class DataRange(object):
         if not (top or right or bottom or left):
             return
 
-        if style not in ['SOLID', 'DOTTED', 'DASHED', 'SOLID', 'SOLID_MEDIUM', 'SOLID_THICK', 'DOUBLE', 'NONE']:
+        if style not in BORDER_STYLES:
             raise ValueError('specified value is not a valid border style')
 
-        request = {"updateBorders": {"range": self._get_gridrange()}}
-
         border = {
             "style": style,
             "width": width,
@@ -365,19 +440,11 @@ class DataRange(object):
                 "green": green,
                 "blue": blue
             }}
-
-        if top:
-            request["updateBorders"]["top"] = border
-        if bottom:
-            request["updateBorders"]["bottom"] = border
-        if left:
-            request["updateBorders"]["left"] = border
-        if right:
-            request["updateBorders"]["right"] = border
-        if inner_horizontal:
-            request["updateBorders"]["innerHorizontal"] = border
-        if inner_vertical:
-            request["updateBorders"]["innerVertical"] = border
+        sides = (("top", top), ("bottom", bottom), ("left", left), ("right", right),
+                 ("innerHorizontal", inner_horizontal), ("innerVertical", inner_vertical))
+        borders_request = {side: border for side, enabled in sides if enabled}
+        borders_request["range"] = self._get_gridrange()
+        request = {"updateBorders": borders_request}
 
         self._worksheet.client.sheet.batch_update(self._worksheet.spreadsheet.id, request)
 
@@ -395,25 +462,34 @@ class DataRange(object):
         self._worksheet.merge_cells(merge_type=merge_type, grange=self.grid_range)
 
     def _get_gridrange(self):
-        return self.grid_range.to_json()
+        # the json is rebuilt only if the sheet or the indexes of the range have changed
+        grange = self.grid_range
+        key = (grange.worksheet_id, grange.start.index, grange.end.index)
+        if self._gridrange_cache is None or self._gridrange_cache[0] != key:
+            self._gridrange_cache = (key, grange.to_json())
+        return self._gridrange_cache[1]
 
     def __getitem__(self, item):
-        if len(self._data[0]) == 0 and self.grid_range.width > 0:
+        if not self._fetched and self.grid_range.width > 0:
             self.fetch()
-        if type(item) is int:
+        if isinstance(item, int):
             try:
                 return self._data[item]
             except IndexError:
                 raise CellNotFound
 
     def __eq__(self, other):
-        return self.start_addr == other.start_addr and self.end_addr == other.end_addr\
-               and self.name == other.name and self.protect_id == other.protect_id
+        if self is other:
+            return True
+        if not isinstance(other, DataRange):
+            return NotImplemented
+        return self._name == other._name and self.start_addr == other.start_addr and self.end_addr == other.end_addr and self.protect_id == other.protect_id
 
     def __repr__(self):
-        range_str = self.range
         if self.worksheet:
             range_str = str(self.grid_range.label)
+        else:
+            range_str = self.range
         protected_str = " protected" if self.protected else ""
 
         return '<%s %s %s%s>' % (self.__class__.__name__, str(self._name), range_str, protected_str)
@@ -421,7 +497,10 @@ class DataRange(object):
 
 class ProtectedRangeProperties(object):
 
+    __slots__ = ('protected_id', 'description', 'warningOnly', 'requestingUserCanEdit', 'editors', '_json_cache')
+
     def __init__(self, api_obj=None):
+        self._json_cache = None
         self.protected_id = None
         self.description = None
         self.warningOnly = None
@@ -431,7 +510,7 @@ class ProtectedRangeProperties(object):
             self.set_json(api_obj)
 
     def set_json(self, api_obj):
-        if type(api_obj) is not dict:
+        if not isinstance(api_obj, dict):
             raise InvalidArgumentValue
         self.protected_id = api_obj['protectedRangeId']
         self.description = api_obj.get('description', '')
@@ -439,15 +518,25 @@ class ProtectedRangeProperties(object):
         self.warningOnly = api_obj.get('warningOnly', False)
         self.requestingUserCanEdit = api_obj.get('requestingUserCanEdit', None)
 
+    def __setattr__(self, name, value):
+        # any property change invalidates the cached json
+        if name != '_json_cache':
+            object.__setattr__(self, '_json_cache', None)
+        object.__setattr__(self, name, value)
+
     def to_json(self):
-        api_obj = {
-            "protectedRangeId": self.protected_id,
-            "description": self.description,
-            "warningOnly": self.warningOnly,
-            "requestingUserCanEdit": self.requestingUserCanEdit,
-            "editors": self.editors
-        }
-        return api_obj
+        if self._json_cache is None:
+            api_obj = {
+                "protectedRangeId": self.protected_id,
+                "description": self.description,
+                "warningOnly": self.warningOnly,
+                "requestingUserCanEdit": self.requestingUserCanEdit,
+                "editors": self.editors
+            }
+            # unset properties are left out of the request body
+            self._json_cache = {k: v for k, v in api_obj.items() if v is not None}
+        # callers extend the returned body, so they get their own copy of the cached one
+        return dict(self._json_cache)
 
     def is_protected(self):
         return self.protected_id is not None
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-.
 
 
-class DeveloperMetadataLookupDataFilter:
+class DeveloperMetadataLookupDataFilter(object):
     """Class for filtering developer metadata queries
 
     This class only supports filtering for metadata on a whole spreadsheet or
@@ -14,18 +14,26 @@ class DeveloperMetadataLookupDataFilter:
     :param meta_value:      Developer metadata value to filter on (optional)
     """
 
+    __slots__ = ('spreadsheet_id', 'sheet_id', 'meta_id', 'meta_key', 'meta_value')
+
     def __init__(self, spreadsheet_id=None, sheet_id=None, meta_id=None, meta_key=None, meta_value=None):
         self.spreadsheet_id = spreadsheet_id
         self.sheet_id = sheet_id
-        self.meta_filters = {
-            "metadataId": meta_id,
-            "metadataKey": meta_key,
-            "metadataValue": meta_value,
+        self.meta_id = meta_id
+        self.meta_key = meta_key
+        self.meta_value = meta_value
+
+    @property
+    def meta_filters(self):
+        return {
+            "metadataId": self.meta_id,
+            "metadataKey": self.meta_key,
+            "metadataValue": self.meta_value,
             "metadataLocation": self.location
         }
 
     def to_json(self):
-        lookup = dict((k, v) for k, v in self.meta_filters.items() if v is not None)
+        lookup = {k: v for k, v in self.meta_filters.items() if v is not None}
         return {"developerMetadataLookup": lookup}
 
     @property
@@ -39,6 +47,9 @@ class DeveloperMetadataLookupDataFilter:
 
 
 class DeveloperMetadata(object):
+
+    __slots__ = ('_id', 'key', 'value', 'client', 'spreadsheet_id', 'sheet_id', '_filter', '_synced')
+
     @classmethod
     def new(cls, key, value, client, spreadsheet_id, sheet_id=None):
         """Create a new developer metadata entry
@@ -78,6 +89,8 @@ class DeveloperMetadata(object):
         self.sheet_id = sheet_id
         self._filter = DeveloperMetadataLookupDataFilter(self.spreadsheet_id,
                                                          self.sheet_id, self.id)
+        # key and value as last seen on the spreadsheet
+        self._synced = (key, value)
 
     def __repr__(self):
         return "<DeveloperMetadata id={} key={} value={}>".format(repr(self.id),
@@ -93,12 +106,22 @@ class DeveloperMetadata(object):
         response = self.client.sheet.developer_metadata_get(self.spreadsheet_id, self.id)
         self.key = response["metadataKey"]
         self.value = response["metadataValue"]
+        self._synced = (self.key, self.value)
 
-    def update(self):
-        """Push the current local values to the spreadsheet"""
+    def update(self, force=False):
+        """Push the current local values to the spreadsheet
+
+        Nothing is sent if the key and value are unchanged since they were last fetched or pushed.
+
+        :param force:   Push the values even if they are unchanged.
+        """
+        if not force and self._synced == (self.key, self.value):
+            return
         self.client.sheet.developer_metadata_update(self.spreadsheet_id, self.key,
                                                     self.value, self._filter.location,
                                                     self._filter.to_json())
+        # in batch mode the request is only queued, so it is sent again on the next update
+        self._synced = None if self.client.sheet.batch_mode else (self.key, self.value)
 
     def delete(self):
         """Delete this developer metadata entry"""
@@ -1,16 +1,18 @@
 from pygsheets.spreadsheet import Spreadsheet
 from pygsheets.worksheet import Worksheet
 from pygsheets.custom_types import ExportType
+from pygsheets.utils import load_discovery_document
 from pygsheets.exceptions import InvalidArgumentValue, CannotRemoveOwnerError, FolderNotFound
 
 from googleapiclient import discovery
 from googleapiclient.http import MediaIoBaseDownload
 from googleapiclient.errors import HttpError
 
+import copy
 import logging
-import json
 import os
 import re
+import time
 
 """
 pygsheets.drive
@@ -20,12 +22,16 @@ This module provides wrappers for the Google Drive API v3.
 
 """
 
-PERMISSION_ROLES = ['organizer', 'owner', 'writer', 'commenter', 'reader']
-PERMISSION_TYPES = ['user', 'group', 'domain', 'anyone']
+PERMISSION_ROLES = frozenset(['organizer', 'owner', 'writer', 'commenter', 'reader'])
+PERMISSION_TYPES = frozenset(['user', 'group', 'domain', 'anyone'])
+PERMISSION_BODY_FIELDS = ('emailAddress', 'domain', 'allowFileDiscovery', 'expirationTime')
 
-FIELDS_TO_INCLUDE = 'files(id, name, parents), nextPageToken, incompleteSearch'
+FILE_FIELDS_TO_INCLUDE = 'id, name, parents'
+FIELDS_TO_INCLUDE = 'files({}), nextPageToken, incompleteSearch'
+METADATA_CACHE_TTL = 30
+EXPORT_CHUNK_SIZE = 10 * 1024 * 1024  # the export api is limited to 10 MB
 
-_EMAIL_PATTERN = re.compile(r"\"?([-a-zA-Z0-9.`?{}]+@[-a-zA-Z0-9.]+\.\w+)\"?")
+_EMAIL_PATTERN = re.compile(r"\"?([-a-zA-Z0-9.`?{}]+@[-a-zA-Z0-9.]+\.\w+)\"?", re.ASCII)
 DISCOVERY_SERVICE_URL = 'https://www.googleapis.com/discovery/v1/apis/drive/v3/rest'
 
 
@@ -41,6 +47,10 @@ class DriveAPIWrapper(object):
 
     See `reference <https://developers.google.com/drive/v3/reference/>`__ for details.
 
+    Spreadsheet metadata listings are cached for `metadata_cache_ttl` seconds. The cache is cleared whenever a
+    file is created, copied, moved, updated or deleted through this wrapper. Set `metadata_cache_ttl` to 0 to
+    disable caching.
+
     :param http:            HTTP object to make requests with.
     :param data_path:       Path to the drive discovery file.
     """
@@ -51,9 +61,9 @@ class DriveAPIWrapper(object):
     def __init__(self, http, data_path, retries=3, logger=logging.getLogger(__name__), request_builder=None):
 
         try:
-            with open(os.path.join(data_path, "drive_discovery.json")) as jd:
-                self.service = discovery.build_from_document(json.load(jd), http=http, requestBuilder=request_builder)
-        except:
+            document = load_discovery_document(os.path.join(data_path, "drive_discovery.json"))
+            self.service = discovery.build_from_document(document, http=http, requestBuilder=request_builder)
+        except Exception:
             self.service = discovery.build('drive', 'v3', http=http, discoveryServiceUrl=DISCOVERY_SERVICE_URL, requestBuilder=request_builder)
         self.team_drive_id = None
         self.include_team_drive_items = True  # TODO Deprecated remove
@@ -61,6 +71,12 @@ class DriveAPIWrapper(object):
         """Include files from TeamDrive and My Drive when executing requests."""
         self.logger = logger
         self.retries = retries
+        self.metadata_cache_ttl = METADATA_CACHE_TTL
+        self._metadata_cache = dict()
+
+    def clear_metadata_cache(self):
+        """Discard all cached spreadsheet metadata."""
+        self._metadata_cache = dict()
 
     def enable_team_drive(self, team_drive_id):
         """Access TeamDrive instead of the users personal drive."""
@@ -129,9 +145,11 @@ class DriveAPIWrapper(object):
 
         :param name: The name of the folder to find
         """
+        # let drive filter on the name instead of listing every folder
+        query = "name = '%s'" % name.replace('\\', '\\\\').replace("'", "\\'")
         try:
-            return list(filter(lambda x: x['name'] == name, self.folder_metadata()))[0]["id"]
-        except (KeyError, IndexError):
+            return next(x["id"] for x in self.folder_metadata(query=query) if x.get("name") == name)
+        except (KeyError, StopIteration):
             raise FolderNotFound('Could not find a folder with name %s.' % name)
 
     def folder_metadata(self, query='', only_team_drive=False):
@@ -145,21 +163,36 @@ class DriveAPIWrapper(object):
         """
         return self._metadata_for_mime_type(self._folder_mime_type, query, only_team_drive)
 
-    def spreadsheet_metadata(self, query='', only_team_drive=False, fid=None):
+    def spreadsheet_metadata(self, query='', only_team_drive=False, fid=None, fields=None):
         """Fetch spreadsheet titles, ids & and parent folder ids.
 
-        The query string can be used to filter the returned metadata.
+        The query string can be used to filter the returned metadata. The fields string can be used to limit
+        the returned file properties, e.g. 'id' or 'id, name'.
 
         Reference: `search parameters docs. <https://developers.google.com/drive/v3/web/search-parameters>`__
 
         :param fid: id of file [optional]
         :param query:   Can be used to filter the returned metadata.
+        :param fields:  Comma separated file fields to return. (default: id, name & parents)
         """
         if fid:
-            return self._execute_request(self.service.files().get(fileId=fid, supportsAllDrives=self.is_team_drive()))
-        return self._metadata_for_mime_type(self._spreadsheet_mime_type, query, only_team_drive)
+            kwargs = {'fields': fields} if fields else {}
+            return self._execute_request(self.service.files().get(fileId=fid, supportsAllDrives=self.is_team_drive(),
+                                                                  **kwargs))
+
+        key = (query, only_team_drive, self.team_drive_id, fields)
+        now = time.monotonic()
+        cached = self._metadata_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return copy.deepcopy(cached[1])
+        result = self._metadata_for_mime_type(self._spreadsheet_mime_type, query, only_team_drive, fields)
+        if self.metadata_cache_ttl > 0:
+            # drop expired listings, so distinct queries do not pile up in a long lived client
+            self._metadata_cache = {k: v for k, v in self._metadata_cache.items() if v[0] > now}
+            self._metadata_cache[key] = (now + self.metadata_cache_ttl, copy.deepcopy(result))
+        return result
 
-    def _metadata_for_mime_type(self, mime_type, query, only_team_drive):
+    def _metadata_for_mime_type(self, mime_type, query, only_team_drive, fields=None):
         """
         Implementation for fetching drive object metadata by mime type
         """
@@ -168,11 +201,12 @@ class DriveAPIWrapper(object):
             query = query + ' and ' + str(mime_type_query)
         else:
             query = mime_type_query
-        result = self.list(fields=FIELDS_TO_INCLUDE,
+        fields = FIELDS_TO_INCLUDE.format(fields or FILE_FIELDS_TO_INCLUDE)
+        result = self.list(fields=fields,
                            q=query, pageSize=500, orderBy='recency')
 
         if self.is_team_drive() and not result and not only_team_drive:
-            return self.list(fields=FIELDS_TO_INCLUDE, corpora="allDrives",
+            return self.list(fields=fields, corpora="allDrives",
                              q=query, pageSize=500, orderBy='recency')
         return result
 
@@ -190,6 +224,7 @@ class DriveAPIWrapper(object):
         """
         kwargs['supportsAllDrives'] = self.is_team_drive()
 
+        self.clear_metadata_cache()
         self._execute_request(self.service.files().delete(fileId=file_id, **kwargs))
 
     def move_file(self, file_id, old_folder, new_folder, body=None, **kwargs):
@@ -225,6 +260,7 @@ class DriveAPIWrapper(object):
         body['name'] = title
         if folder:
             body['parents'] = [folder]
+        self.clear_metadata_cache()
         return self._execute_request(self.service.files().copy(fileId=file_id, body=body, **kwargs))
 
     def update_file(self, file_id, body=None, **kwargs):
@@ -241,6 +277,7 @@ class DriveAPIWrapper(object):
         if body is not None:
             kwargs["body"] = body
 
+        self.clear_metadata_cache()
         return self._execute_request(self.service.files().update(fileId=file_id, **kwargs))
 
     def _export_request(self, file_id, mime_type, **kwargs):
@@ -289,12 +326,13 @@ class DriveAPIWrapper(object):
         import io
         file_name = str(sheet.id or tmp) + file_extension if filename is None else filename + file_extension
         file_path = os.path.join(path, file_name)
-        fh = io.FileIO(file_path, 'wb')
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-        while done is False:
-            status, done = downloader.next_chunk()
-            # logging.info('Download progress: %d%%.', int(status.progress() * 100)) TODO fix this
+        with io.open(file_path, 'wb') as fh:
+            # a single chunk covers any file the export api can return
+            downloader = MediaIoBaseDownload(fh, request, chunksize=EXPORT_CHUNK_SIZE)
+            done = False
+            while done is False:
+                status, done = downloader.next_chunk()
+                # logging.info('Download progress: %d%%.', int(status.progress() * 100)) TODO fix this
         logging.info('Download finished. File saved in %s.', file_path)
 
         if tmp is not None:
@@ -340,9 +378,9 @@ class DriveAPIWrapper(object):
         if 'emailAddress' in kwargs and 'domain' in kwargs:
             raise InvalidArgumentValue('A permission can only use emailAddress or domain. Do not specify both.')
         if role not in PERMISSION_ROLES:
-            raise InvalidArgumentValue('A permission role can only be one of ' + str(PERMISSION_ROLES) + '.')
+            raise InvalidArgumentValue('A permission role can only be one of ' + str(sorted(PERMISSION_ROLES)) + '.')
         if type not in PERMISSION_TYPES:
-            raise InvalidArgumentValue('A permission role can only be one of ' + str(PERMISSION_TYPES) + '.')
+            raise InvalidArgumentValue('A permission type can only be one of ' + str(sorted(PERMISSION_TYPES)) + '.')
 
         body = {
             'kind': 'drive#permission',
@@ -350,20 +388,10 @@ class DriveAPIWrapper(object):
             'role': role
         }
 
-        if 'emailAddress' in kwargs:
-            body['emailAddress'] = kwargs['emailAddress']
-            del kwargs['emailAddress']
-        elif 'domain' in kwargs:
-            body['domain'] = kwargs['domain']
-            del kwargs['domain']
-
-        if 'allowFileDiscovery' in kwargs:
-            body['allowFileDiscovery'] = kwargs['allowFileDiscovery']
-            del kwargs['allowFileDiscovery']
-
-        if 'expirationTime' in kwargs:
-            body['expirationTime'] = kwargs['expirationTime']
-            del kwargs['expirationTime']
+        # the permission resource fields go into the body, the rest are request parameters
+        for key in PERMISSION_BODY_FIELDS:
+            if key in kwargs:
+                body[key] = kwargs.pop(key)
 
         return self._execute_request(self.service.permissions().create(fileId=file_id, body=body, **kwargs))
 
@@ -1,17 +1,18 @@
 from pygsheets.spreadsheet import Spreadsheet
-from pygsheets.utils import format_addr
+from pygsheets.utils import format_addr, load_discovery_document
 from pygsheets.exceptions import InvalidArgumentValue
 from pygsheets.custom_types import ValueRenderOption, DateTimeRenderOption
 
 from googleapiclient import discovery
 from googleapiclient.errors import HttpError
 
+from operator import itemgetter
 import logging
-import json
 import os
 import time
 
 GOOGLE_SHEET_CELL_UPDATES_LIMIT = 50000
+BATCH_HTTP_REQUEST_LIMIT = 100
 DISCOVERY_SERVICE_URL = 'https://sheets.googleapis.com/$discovery/rest?version=v4'
 
 
@@ -37,9 +38,9 @@ class SheetAPIWrapper(object):
 
         self.logger = logger
         try:
-            with open(os.path.join(data_path, "sheets_discovery.json")) as jd:
-                self.service = discovery.build_from_document(json.load(jd), http=http, requestBuilder=request_builder)
-        except:
+            document = load_discovery_document(os.path.join(data_path, "sheets_discovery.json"))
+            self.service = discovery.build_from_document(document, http=http, requestBuilder=request_builder)
+        except Exception:
             self.service = discovery.build('sheets', 'v4', http=http, discoveryServiceUrl=DISCOVERY_SERVICE_URL, requestBuilder=request_builder)
         self.retries = retries
         self.seconds_per_quota = seconds_per_quota
@@ -52,11 +53,20 @@ class SheetAPIWrapper(object):
         self.batched_requests = dict()
 
     def run_batch(self):
-        for ss, req in self.batched_requests.items():
+        """Run all batched requests. All requests queued for a spreadsheet are sent as a single batchUpdate.
+
+        :return: A dict mapping each spreadsheet id to its batchUpdate response.
+        """
+        responses = dict()
+        batch_update_request = self.service.spreadsheets().batchUpdate
+        for ss in list(self.batched_requests):
+            req = self.batched_requests.pop(ss)
+            if not req:
+                continue
             body = {'requests': req}
-            request = self.service.spreadsheets().batchUpdate(spreadsheetId=ss, body=body)
-            return self._execute_requests(request)
-        self.batched_requests = dict()
+            request = batch_update_request(spreadsheetId=ss, body=body)
+            responses[ss] = self._execute_requests(request)
+        return responses
 
     def batch_update(self, spreadsheet_id, requests, **kwargs):
         """
@@ -91,20 +101,17 @@ class SheetAPIWrapper(object):
         +-----------------------------------+-----------------------------------------------------+
 
         :param spreadsheet_id:  The spreadsheet to apply the updates to.
-        :param requests:        A list of updates to apply to the spreadsheet. Requests will be applied in the order
+        :param requests:        A list or tuple of updates to apply to the spreadsheet. Requests will be applied in the order
                                 they are specified. If any request is not valid, no requests will be applied.
         :param kwargs:          Request body params & standard parameters (see reference for details).
         :return:
         """
 
-        if not isinstance(requests, list):
+        if not isinstance(requests, (list, tuple)):
             requests = [requests]
 
         if self.batch_mode:
-            if spreadsheet_id in self.batched_requests:
-                self.batched_requests[spreadsheet_id].extend(requests)
-            else:
-                self.batched_requests[spreadsheet_id] = requests
+            self.batched_requests.setdefault(spreadsheet_id, []).extend(requests)
             return
 
         body = {'requests': requests}
@@ -164,6 +171,54 @@ class SheetAPIWrapper(object):
             kwargs['includeGridData'] = True
         return self._execute_requests(self.service.spreadsheets().get(spreadsheetId=spreadsheet_id, **kwargs))
 
+    def batch_get(self, spreadsheet_ids, **kwargs):
+        """Returns several spreadsheets using batched HTTP requests.
+
+        Equivalent to calling :meth:`get` for each id, but the requests are bundled into
+        `batch requests <https://developers.google.com/sheets/api/guides/batch>`__ of at most
+        BATCH_HTTP_REQUEST_LIMIT requests each. Requests which fail inside a batch, e.g. because of the
+        rate limit, are repeated with :meth:`get`.
+
+        :param spreadsheet_ids: The ids of the spreadsheets to return.
+        :param kwargs:          Standard parameters (see reference for details).
+        :return:                A list of SheetResources in the order of the given ids.
+        """
+        if 'fields' not in kwargs:
+            kwargs['fields'] = '*'
+        if 'includeGridData' not in kwargs:
+            kwargs['includeGridData'] = True
+
+        responses = dict()
+        for start in range(0, len(spreadsheet_ids), BATCH_HTTP_REQUEST_LIMIT):
+            indices = range(start, min(start + BATCH_HTTP_REQUEST_LIMIT, len(spreadsheet_ids)))
+            self._execute_batch_get(spreadsheet_ids, indices, responses, **kwargs)
+        return self._collect_batch_get(spreadsheet_ids, responses, **kwargs)
+
+    def _execute_batch_get(self, spreadsheet_ids, indices, responses, **kwargs):
+        """Send one batch request getting the spreadsheets at the given indices. The responses of
+        successful requests are stored in responses by index."""
+        def callback(request_id, response, exception):
+            if exception is None:
+                responses[int(request_id)] = response
+
+        get_request = self.service.spreadsheets().get
+        batch = self.service.new_batch_http_request(callback=callback)
+        for index in indices:
+            batch.add(get_request(spreadsheetId=spreadsheet_ids[index], **kwargs), request_id=str(index))
+        try:
+            batch.execute()
+        except HttpError as error:
+            if error.resp['status'] != '429' or not self.check:
+                raise
+
+    def _collect_batch_get(self, spreadsheet_ids, responses, **kwargs):
+        """Order the batched responses by spreadsheet id. Failed requests are repeated one by one
+        with :meth:`get`, so retries and the quota back off apply to them."""
+        for index in range(len(spreadsheet_ids)):
+            if index not in responses:
+                responses[index] = self.get(spreadsheet_ids[index], **kwargs)
+        return [responses[index] for index in range(len(spreadsheet_ids))]
+
     #################################
     #     BATCH UPDATE REQUESTS     #
     #################################
@@ -307,12 +362,6 @@ class SheetAPIWrapper(object):
                                             dateTime render option is [DateTimeRenderOption.SERIAL_NUMBER].
         :return:                            `ValueRange <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values#ValueRange>`_
         """
-        if isinstance(value_render_option, ValueRenderOption):
-            value_render_option = value_render_option.value
-
-        if isinstance(date_time_render_option, DateTimeRenderOption):
-            date_time_render_option = date_time_render_option.value
-
         request = self.service.spreadsheets().values().batchGet(spreadsheetId=spreadsheet_id,
                                                                 ranges=value_ranges,
                                                                 majorDimension=major_dimension,
@@ -335,8 +384,7 @@ class SheetAPIWrapper(object):
         """
         cformat = 'USER_ENTERED' if parse else 'RAW'
         batch_limit = GOOGLE_SHEET_CELL_UPDATES_LIMIT
-        lengths = [len(x) for x in body['values']]
-        avg_row_length = (min(lengths) + max(lengths))/2
+        avg_row_length = (min(map(len, body['values'])) + max(map(len, body['values'])))/2
         avg_row_length = 1 if avg_row_length == 0 else avg_row_length
         if body['majorDimension'] == 'ROWS':
             batch_length = int(batch_limit / avg_row_length)  # num of rows to include in a batch
@@ -355,22 +403,21 @@ class SheetAPIWrapper(object):
             values = body['values']
             title, value_range = body['range'].split('!')
             value_range_start, value_range_end = value_range.split(':')
-            value_range_end = list(format_addr(str(value_range_end), output='tuple'))
-            value_range_start = list(format_addr(str(value_range_start), output='tuple'))
-            max_rows = value_range_end[0]
-            start_row = value_range_start[0]
+            start_row, start_col = format_addr(str(value_range_start), output='tuple')
+            max_rows, end_col = format_addr(str(value_range_end), output='tuple')
+            # columns stay the same for every batch, only the row numbers change
+            start_prefix = title + '!' + format_addr((None, start_col), output='label')
+            end_prefix = ':' + format_addr((None, end_col), output='label')
+            update_request = self.service.spreadsheets().values().update
             for batch_start in range(0, num_rows, batch_length):
                 if body['majorDimension'] == 'ROWS':
                     body['values'] = values[batch_start:batch_start + batch_length]
                 else:
-                    body['values'] = [col[batch_start:batch_start + batch_length] for col in values]
-                value_range_start[0] = batch_start + start_row
-                value_range_end[0] = min(batch_start + batch_length, max_rows) + start_row
-                body['range'] = title + '!' + format_addr(tuple(value_range_start), output='label') + ':' + \
-                                format_addr(tuple(value_range_end), output='label')
-                request = self.service.spreadsheets().values().update(spreadsheetId=spreadsheet_id, body=body,
-                                                                      range=body['range'],
-                                                                      valueInputOption=cformat)
+                    body['values'] = list(map(itemgetter(slice(batch_start, batch_start + batch_length)), values))
+                body['range'] = '%s%d%s%d' % (start_prefix, batch_start + start_row,
+                                              end_prefix, min(batch_start + batch_length, max_rows) + start_row)
+                request = update_request(spreadsheetId=spreadsheet_id, body=body, range=body['range'],
+                                         valueInputOption=cformat)
                 self._execute_requests(request)
 
     def values_batch_update_by_data_filter(self, spreadsheet_id, data, parse=True):
@@ -406,12 +453,6 @@ class SheetAPIWrapper(object):
                                             dateTime render option is [DateTimeRenderOption.SERIAL_NUMBER].
         :return:                            `ValueRange <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values#ValueRange>`_
         """
-        if isinstance(value_render_option, ValueRenderOption):
-            value_render_option = value_render_option.value
-
-        if isinstance(date_time_render_option, DateTimeRenderOption):
-            date_time_render_option = date_time_render_option.value
-
         request = self.service.spreadsheets().values().get(spreadsheetId=spreadsheet_id,
                                                            range=value_range,
                                                            majorDimension=major_dimension,
@@ -58,6 +58,7 @@ class Spreadsheet(object):
         self._title = value
         self._jsonsheet['properties']['title'] = value
         self.update_properties()
+        self.client.drive.clear_metadata_cache()
     
     @property
     def locale(self):
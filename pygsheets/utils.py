@@ -9,9 +9,14 @@ This module contains utility functions.
 """
 
 from pygsheets.exceptions import (IncorrectCellLabel, InvalidArgumentValue)
-from functools import wraps
+from functools import wraps, lru_cache
+import json
 import re
 
+_discovery_documents = dict()
+_cell_addr_re = re.compile(r'([A-Za-z]+)(\d+)', re.ASCII)
+_MAGIC_NUMBER = 64
+
 
 def finditem(func, seq):
     """Finds and returns first item in iterable for which func(item) is True.
@@ -72,63 +77,85 @@ def is_number(n):
 
 
 def format_addr(addr, output='flip'):
-        """
-        function to convert address format of cells from one to another
-
-        :param addr: address as tuple or label
-        :param output: -'label' will output label
-                      - 'tuple' will output tuple
-                      - 'flip' will convert to other type
-        :returns: tuple or label
-        """
-        _MAGIC_NUMBER = 64
-        if type(addr) == tuple:
-            if output == 'label' or output == 'flip':
-                # return self.get_addr_int(*addr)
-                if addr[0] is None:
-                    row_label = ''
-                else:
-                    row = int(addr[0])
-                    if row < 1:
-                        raise IncorrectCellLabel(repr(addr))
-                    row_label = str(row)
-
-                if addr[1] is None:
-                    column_label = ''
-                else:
-                    col = int(addr[1])
-                    if col < 1:
-                        raise IncorrectCellLabel(repr(addr))
-                    div = col
-                    column_label = ''
-                    while div:
-                        (div, mod) = divmod(div, 26)
-                        if mod == 0:
-                            mod = 26
-                            div -= 1
-                        column_label = chr(mod + _MAGIC_NUMBER) + column_label
-                label = '%s%s' % (column_label, row_label)
-                return label
-
-            elif output == 'tuple':
-                return addr
-
-        elif type(addr) == str:
-            if output == 'tuple' or output == 'flip':
-                _cell_addr_re = re.compile(r'([A-Za-z]+)(\d+)')
-                m = _cell_addr_re.match(addr)
-                if m:
-                    column_label = m.group(1).upper()
-                    row, col = int(m.group(2)), 0
-                    for i, c in enumerate(reversed(column_label)):
-                        col += (ord(c) - _MAGIC_NUMBER) * (26 ** i)
-                else:
-                    raise IncorrectCellLabel(addr)
-                return int(row), int(col)
-            elif output == 'label':
-                return addr
-        else:
-            raise InvalidArgumentValue("addr of type " + str(type(addr)))
+    """
+    function to convert address format of cells from one to another
+
+    :param addr: address as tuple or label
+    :param output: -'label' will output label
+                  - 'tuple' will output tuple
+                  - 'flip' will convert to other type
+    :returns: tuple or label
+    """
+    addr_type = type(addr)
+    if addr_type is not tuple and addr_type is not str:
+        raise InvalidArgumentValue("addr of type " + str(addr_type))
+    # addresses already in the requested format are returned as given, equal
+    # keys like (2.0, 3.0) and (2, 3) would share a cache entry otherwise
+    if (output == 'tuple' and addr_type is tuple) or (output == 'label' and addr_type is str):
+        return addr
+    return _format_addr(addr, output)
+
+
+@lru_cache(maxsize=4096)
+def _format_addr(addr, output):
+    if type(addr) is tuple:
+        if output == 'label' or output == 'flip':
+            return _tuple_to_label(addr)
+    elif output == 'tuple' or output == 'flip':
+        return _label_to_tuple(addr)
+
+
+def _tuple_to_label(addr):
+    if addr[0] is None:
+        row_label = ''
+    else:
+        row = int(addr[0])
+        if row < 1:
+            raise IncorrectCellLabel(repr(addr))
+        row_label = str(row)
+
+    if addr[1] is None:
+        column_label = ''
+    else:
+        col = int(addr[1])
+        if col < 1:
+            raise IncorrectCellLabel(repr(addr))
+        div = col
+        column_label = ''
+        while div:
+            (div, mod) = divmod(div, 26)
+            if mod == 0:
+                mod = 26
+                div -= 1
+            column_label = chr(mod + _MAGIC_NUMBER) + column_label
+    return '%s%s' % (column_label, row_label)
+
+
+def _label_to_tuple(addr):
+    m = _cell_addr_re.match(addr)
+    if not m:
+        raise IncorrectCellLabel(addr)
+    column_label = m.group(1).upper()
+    row, col = int(m.group(2)), 0
+    for i, c in enumerate(reversed(column_label)):
+        col += (ord(c) - _MAGIC_NUMBER) * (26 ** i)
+    return int(row), int(col)
+
+
+def load_discovery_document(path):
+    """Load a discovery document from disk.
+
+    Documents are parsed once per process and shared by all clients.
+
+    :param path: path to the discovery json file
+    :returns: the parsed discovery document
+    """
+    try:
+        return _discovery_documents[path]
+    except KeyError:
+        with open(path) as jd:
+            document = _discovery_documents[path] = json.load(jd)
+        return document
 
 
 def fullmatch(regex, string, flags=0):
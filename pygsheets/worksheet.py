@@ -14,7 +14,7 @@ import warnings
 import logging
 
 from pygsheets.cell import Cell
-from pygsheets.datarange import DataRange
+from pygsheets.datarange import DataRange, DEFAULT_FORMAT_FIELDS
 from pygsheets.address import GridRange, Address
 from pygsheets.exceptions import (CellNotFound, InvalidArgumentValue, RangeNotFound)
 from pygsheets.utils import numericise_all, format_addr, fullmatch, batchable, allow_gridrange, get_color_style, get_boolean_condition
@@ -986,7 +986,8 @@ class Worksheet(object):
         """
         apply formatting for for multiple ranges
 
-        :param ranges: list of ranges (any type) to apply the formats to
+        :param ranges: list of ranges (any type, including :class:`DataRange`) to apply the formats to. A DataRange
+                       is formatted on its own worksheet, which must be in this spreadsheet.
         :param format_info: list or single pygsheets cell or dict of properties specifying the formats to be updated,
          see `this <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/cells#CellFormat>`__
          for available options. if a list is given it should match size of ranges.
@@ -999,27 +1000,38 @@ class Worksheet(object):
         >>> mcell = Cell('A1')  # dummy cell
         >>> mcell.format = (pygsheets.FormatType.PERCENT, '')
         >>> wks.apply_format(ranges=['A1:B1', 'D:E'], format_info=mcell)
+        >>> wks.apply_format(ranges=[drange1, drange2], format_info=mcell)  # DataRange objects
 
         """
         requests = []
         format_info = [format_info] if not isinstance(format_info, list) else format_info
         model_cells = [{"numberFormat": {"type": x.upper()}} if isinstance(x, str) else x for x in format_info]
+        # serialize each model cell once, even when it is shared by all the ranges
+        model_cells = [x.get_json() if isinstance(x, Cell) else {"userEnteredFormat": x} for x in model_cells]
         ranges = [ranges] if not isinstance(ranges, list) else ranges
         if len(model_cells) == 1:
             model_cells = model_cells * len(ranges)
-        for crange, cell in zip(ranges, model_cells):
-            range_json = GridRange.create(crange, self).to_json()
-            if isinstance(cell, Cell):
-                cell = cell.get_json()
+        for crange, cell_json in zip(ranges, model_cells):
+            if isinstance(crange, DataRange):
+                range_json = self._datarange_json(crange)
             else:
-                cell = {"userEnteredFormat": cell}
+                range_json = GridRange.create(crange, self).to_json()
             requests.append({"repeatCell": {
                 "range": range_json,
-                "cell": cell,
-                "fields": fields or "userEnteredFormat,hyperlink,note,textFormatRuns,dataValidation,pivotTable"
+                "cell": cell_json,
+                "fields": fields or DEFAULT_FORMAT_FIELDS
             }})
         self.client.sheet.batch_update(self.spreadsheet.id, requests)
 
+    def _datarange_json(self, drange):
+        """ GridRange json of a DataRange in this spreadsheet, without changing the range itself """
+        if drange.worksheet is not None and drange.worksheet.spreadsheet.id != self.spreadsheet.id:
+            raise InvalidArgumentValue("The range %s belongs to another spreadsheet." % drange.range)
+        if drange.grid_range.worksheet_id is None:
+            # a range without a sheet is applied to this worksheet
+            return GridRange(worksheet=self, start=drange.start_addr, end=drange.end_addr).to_json()
+        return dict(drange._get_gridrange())
+
     @batchable
     def update_dimensions_visibility(self, start, end=None, dimension="ROWS", hidden=True):
         """Hide or show one or more rows or columns.
@@ -133,6 +133,66 @@ class TestClient(object):
         if exception:
             pytest.fail(str(exception))
 
+    def test_batch(self):
+        worksheet = self.spreadsheet.sheet1
+        old_title = worksheet.title
+
+        with pygsheet_client.batch():
+            worksheet.title = 'test_batch_outer'
+            with pygsheet_client.batch():
+                worksheet.title = 'test_batch_inner'
+            # the nested block leaves the requests to the outer one
+            assert pygsheet_client.sheet.batch_mode
+            assert pygsheet_client.open_by_key(self.spreadsheet.id).sheet1.title == old_title
+        assert not pygsheet_client.sheet.batch_mode
+        assert pygsheet_client.open_by_key(self.spreadsheet.id).sheet1.title == 'test_batch_inner'
+
+        worksheet.title = old_title
+
+    def test_batch_discard_on_exception(self):
+        worksheet = self.spreadsheet.sheet1
+        old_title = worksheet.title
+
+        with pytest.raises(ValueError):
+            with pygsheet_client.batch():
+                worksheet.title = 'test_batch_discarded'
+                raise ValueError
+        assert not pygsheet_client.sheet.batch_mode
+        assert not pygsheet_client.sheet.batched_requests
+        assert pygsheet_client.open_by_key(self.spreadsheet.id).sheet1.title == old_title
+
+        worksheet.title = old_title
+
+    def test_metadata_cache(self):
+        pygsheet_client.drive.clear_metadata_cache()
+        metadata = pygsheet_client.drive.spreadsheet_metadata()
+        assert self.spreadsheet.id in [x['id'] for x in metadata]
+        assert pygsheet_client.drive._metadata_cache
+
+        # cached listings are returned as copies
+        metadata[0]['id'] = 'changed'
+        assert pygsheet_client.drive.spreadsheet_metadata()[0]['id'] != 'changed'
+
+        # creating a spreadsheet discards the cached metadata
+        result = pygsheet_client.create('test_metadata_cache' + PYTHON_VERSION)
+        assert result.id in pygsheet_client.spreadsheet_ids()
+        result.delete()
+
+        pygsheet_client.drive.clear_metadata_cache()
+        assert not pygsheet_client.drive._metadata_cache
+
+    def test_batch_get(self):
+        ids = [self.spreadsheet.id, self.spreadsheet.id]
+        responses = pygsheet_client.sheet.batch_get(ids, fields='spreadsheetId')
+        assert [response['spreadsheetId'] for response in responses] == ids
+        assert pygsheet_client.sheet.batch_get([]) == []
+
+    def test_open_all(self):
+        title = test_config.get('Spreadsheet', 'title') + PYTHON_VERSION
+        spreadsheets = pygsheet_client.open_all(query="name = '{}'".format(title))
+        assert all(isinstance(spreadsheet, pygsheets.Spreadsheet) for spreadsheet in spreadsheets)
+        assert self.spreadsheet.id in [spreadsheet.id for spreadsheet in spreadsheets]
+
 
 # @pytest.mark.skip()
 class TestSpreadSheet(object):
@@ -282,6 +342,21 @@ class TestSpreadSheet(object):
         final_meta = self.spreadsheet.get_developer_metadata()
         assert len(final_meta) == len(old_meta)
 
+    def test_developer_metadata_update_force(self):
+        meta_val = self.spreadsheet.create_developer_metadata("testforcekey", "testvalue")
+        other_meta_val = self.spreadsheet.get_developer_metadata("testforcekey")[0]
+        other_meta_val.value = "othervalue"
+        other_meta_val.update()
+
+        # unchanged local values are not pushed again
+        meta_val.update()
+        assert self.spreadsheet.get_developer_metadata("testforcekey")[0].value == "othervalue"
+
+        meta_val.update(force=True)
+        assert self.spreadsheet.get_developer_metadata("testforcekey")[0].value == "testvalue"
+
+        meta_val.delete()
+
 
 # @pytest.mark.skip()
 class TestWorkSheet(object):
@@ -1154,6 +1229,34 @@ class TestDataRange(object):
         assert self.range.protect_id is None
         assert len(self.spreadsheet.protected_ranges) == 0
 
+    def test_update_values_over_formula(self):
+        self.worksheet.update_value('C1', '=1+1')
+        drange = self.worksheet.range("C1:C1", returnas="range")
+        assert drange.cells[0][0].formula == '=1+1'
+
+        drange.update_values([[5]])
+        cell = drange.cells[0][0]
+        assert cell.formula == ''
+        assert cell.value == '5'
+        assert 'formulaValue' not in cell.get_json()['userEnteredValue']
+        assert self.worksheet.cell('C1').value == '5'
+
+    def test_update_values_refresh(self):
+        drange = self.worksheet.range("D1:D2", returnas="range")
+
+        # raw text is stored in the fetched cells without reading it back
+        self.spreadsheet.default_parse = False
+        try:
+            drange.update_values([['a'], ['b']])
+            assert [row[0].value for row in drange.cells] == ['a', 'b']
+        finally:
+            self.spreadsheet.default_parse = True
+        assert self.worksheet.get_values('D1', 'D2') == [['a'], ['b']]
+
+        drange.update_values([[1], ['=1+1']], refresh=True)
+        assert [row[0].value for row in drange.cells] == ['1', '2']
+        assert drange.cells[1][0].formula == '=1+1'
+
 
 # @pytest.mark.skip()
 class TestCell(object):